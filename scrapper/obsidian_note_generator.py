@@ -1,6 +1,11 @@
 import re
-import json
+import bisect
+import functools
+import multiprocessing
+import tempfile
+import time
 from datetime import datetime
+from types import MappingProxyType
 from typing import Dict
 import os
 from pathlib import Path
@@ -8,11 +13,274 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+# Shared read-only default for missing nested sections, so lookups don't build a new dict on every miss
+_EMPTY = MappingProxyType({})
+
+_NUM_RE = re.compile(r'[\d,]+')
+# Strips the currency symbol and thousands separators from amounts like "R 27 000"
+_AMOUNT_STRIP_TABLE = str.maketrans('', '', ' ,R')
+_NUMERIC_STRIP_TABLE = str.maketrans('', '', ' ,R$')
+
+# Transfer duty brackets: upper bound of each bracket, and the (base duty, marginal rate, lower bound)
+# applied to prices falling in it. The last bracket has no upper bound.
+_DUTY_THRESHOLDS = (1210000, 1663800, 2329300, 2994800, 13310000)
+_DUTY_BRACKETS = (
+    (0, 0, 0),
+    (0, 0.03, 1210000),
+    (13614, 0.06, 1663800),
+    (53544, 0.08, 2329300),
+    (106784, 0.11, 2994800),
+    (1241456, 0.13, 13310000),
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _bond_factor(rate, years):
+    """Return the monthly payment per unit of principal for a given interest rate and term"""
+    monthly_rate = rate / 12
+    num_payments = years * 12
+
+    if monthly_rate == 0:
+        return 1 / num_payments
+
+    growth = (1 + monthly_rate)**num_payments
+    return monthly_rate * growth / (growth - 1)
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_rands(rands):
+    """Format a whole number of rands, e.g. 27000 -> "R27,000". Cached, as prices and costs recur across notes"""
+    return f"R{rands:,}"
+
+
+@functools.lru_cache(maxsize=1024)
+def _amenities_yaml(amenities):
+    """Render a set of amenities as a sorted YAML list, cached as listings often share the same amenities"""
+    if not amenities:
+        return ""
+
+    return "amenities:\n" + "\n".join(f"  - {amenity}" for amenity in sorted(amenities))
+
+
+@functools.lru_cache(maxsize=512)
+def _display_name(key):
+    """Turn a snake_case key into a heading, e.g. swimming_pool -> Swimming Pool"""
+    return key.replace('_', ' ').title()
+
+
+def _validated_directory(directory):
+    """Normalise a vault directory and check it exists, on every construction so a vault removed since is caught"""
+    directory = os.path.normpath(directory)
+    if not os.path.exists(directory):
+        raise Exception(f"Vault directory {directory} does not exist. Please create it and try again.")
+    return directory
+
+
+# Streamed notes land in a temporary file first, which is created owner-only; this is the mode
+# a plain open() would have given the note under the process umask
+_umask = os.umask(0)
+os.umask(_umask)
+_NOTE_FILE_MODE = 0o666 & ~_umask
+del _umask
+
+# Large write buffer for streamed notes, so a whole note goes to disk in very few syscalls
+_NOTE_WRITE_BUFFER = 1 << 20
+
+
+_last_timestamp_second = None
+_last_timestamp = ''
+
+def _current_timestamp():
+    """Return the current local time formatted for notes, reformatting at most once per second"""
+    global _last_timestamp_second, _last_timestamp
+    second = int(time.time())
+    if second != _last_timestamp_second:
+        _last_timestamp = datetime.fromtimestamp(second).strftime('%Y-%m-%d %H:%M:%S')
+        _last_timestamp_second = second
+    return _last_timestamp
+
+
+# Static skeleton of a property note, kept at module level and filled with str.format. The per-property
+# values are substituted by generate_obsidian_note, which also adds the variable-length sections between them.
+_FRONTMATTER_TEMPLATE = """---
+date: {date}
+tags:
+  - property
+  - portfolio
+cssclasses:
+  - page-grid
+  - pen-blue
+  - page-white
+property_type: {property_type}
+status: interested
+source: {source}
+province: {province}
+city: {city}
+suburb: {suburb}
+bedrooms: {bedrooms}
+bathrooms: {bathrooms}
+{amenities_yaml}
+---
+"""
+
+_HEADER_TEMPLATE = """{frontmatter}
+
+# {title}
+
+## Location & Basic Info
+
+| Field | Value |
+|-------|-------|
+| **Address** | {address} |
+| **Suburb** | {suburb} |
+| **City** | {city} |
+| **Province** | {province} |
+| **Property Type** | {property_type} |
+| **Lifestyle** | {lifestyle} |
+| **Listing ID** | {listing_id} |
+| **Listed Date** | {listing_date} |
+
+## Financial Analysis
+
+### Purchase Costs
+
+| Item | Amount |
+|------|--------|
+| **Purchase Price** | {purchase_price} |
+| **Deposit (10%)** | {deposit} |
+| **Transfer Duty** | {transfer_duty} |
+| **Bond Registration** | {bond_registration} |
+| **Transfer Costs** | {transfer_costs} |
+| **Attorney Fees** | {attorney_fees} |
+| **Bond Origination** | {bond_origination} |
+| **Moving Costs** | {moving_costs} |
+| **Security Setup** | {security_setup} |
+| **Immediate Repairs** | {immediate_repairs} |
+| **Total Additional Once Off Cost** | {additional_total_once_off} |
+| **Grand Total Once Off Cost** | {grand_total} |
+
+### Bond Calculations
+
+| Item | Amount |
+|------|--------|
+| **Deposit (10%)** | {bond_deposit} |
+| **Bond Amount** | {bond_amount} |
+| **Interest Rate** | 10.75% (prime) |
+| **Bond Term** | 20 years |
+| **Monthly Payment** | {monthly_bond_payment} |
+
+### Monthly Costs
+
+| Item | Amount |
+|------|--------|
+| **Bond Payment** | {monthly_bond_payment} |
+| **Levies** | {monthly_levies} |
+| **Rates & Taxes** | {monthly_rates_taxes} |
+| **Insurance** | {monthly_insurance} |
+| **Maintenance** | {monthly_maintenance} |
+| **Utilities** | {monthly_utilities} |
+| **Security** | {monthly_security} |
+| **Total Monthly** | {monthly_total_monthly} |
+
+### Investment Metrics
+
+| Metric | Value |
+|--------|-------|
+| **Price per m2** | {price_per_m2} |
+| **Transfer Duty Exempt** | {no_transfer_duty} |
+| **Break-even Rental** | {monthly_total_monthly} |
+
+## Property Features
+
+### Room Layout
+
+"""
+
+_SPECIFICATIONS_TEMPLATE = """
+
+### Property Specifications
+
+| Specification | Value |
+|---------------|-------|
+| **Floor Size** | {floor_size} m2 |
+| **Erf Size** | {erf_size} |
+| **Levies** | {monthly_levies} |
+| **Rates & Taxes** | {monthly_rates_taxes} |
+| **Pets Allowed** | {allowed_pets} |
+"""
+
+_FOOTER_TEMPLATE = """
+
+## Agent Information
+
+| Field | Value |
+|-------|-------|
+| **Agent Name** | {agent_name} |
+| **Agency** | {agency_name} |
+| **Agent Profile** | [{agent_profile_label}]({agent_url}) |
+| **Agency Profile** | [{agency_profile_label}]({agency_url}) |
+
+## Viewing & Assessment
+
+### Viewing Details
+
+- **Viewing Date**: 
+- **Viewing Time**: 
+- **Viewing Notes**: 
+
+### Property Assessment
+
+- **Overall Condition**: 
+- **Score (1-10)**: 
+- **Pros**: 
+  - 
+- **Cons**: 
+  - 
+
+### Decision
+
+- **Status**: 
+- **Decision**: 
+- **Reason**: 
+- **Next Steps**: 
+
+## Documents & Links
+
+### Required Documents
+
+- [ ] Title Deed
+- [ ] Rates Certificate  
+- [ ] Electrical Certificate
+- [ ] Plumbing Certificate
+- [ ] Building Plans
+- [ ] Body Corporate Rules (if applicable)
+
+### Links
+
+- **Property Listing**: [View on Property24]({url})
+- **Property Images**: [View Images]({listing_image})
+
+---
+
+*Last updated: {date}*  
+*Scraped from: {source} on {scraped_date}*
+"""
+
+
+class _NoteFields(dict):
+    """Template fields for a note, where any field missing from the property data renders as 'N/A'"""
+
+    def __missing__(self, key):
+        return 'N/A'
+
+
 class PropertyNoteGenerator:
 
     def __init__(self) -> None:
         self.vault_directory = os.getenv("VAULT_DIRECTORY")
         self.property_directory = os.getenv("PROPERTY_DIRECTORY")
+        if not self.vault_directory or self.property_directory is None:
+            raise Exception("VAULT_DIRECTORY and PROPERTY_DIRECTORY must be set. Please add them to your .env file and try again.")
         self.full_path = self._validate_vault_directory(os.path.join(self.vault_directory, self.property_directory))
 
     def _validate_vault_directory(self, directory):
@@ -24,12 +292,10 @@ class PropertyNoteGenerator:
         Returns:
             str: The validated vault directory
         """
-        directory = os.path.normpath(directory)
-        if not os.path.exists(directory):
-            raise Exception(f"Vault directory {directory} does not exist. Please create it and try again.")
-        return directory
+        return _validated_directory(directory)
 
-    def format_currency(self, amount):
+    @staticmethod
+    def format_currency(amount):
         """Formats a currency amount for display in a note
     
         Args:
@@ -40,23 +306,41 @@ class PropertyNoteGenerator:
         """
         if not amount:
             return "R0"
+
+        if isinstance(amount, (int, float)):
+            return _format_rands(int(amount))
         
         # Handle string amounts like "R 27 000"
         if isinstance(amount, str):
-            numbers = re.findall(r'[\\\\d,]+', amount.replace(' ', ''))
+            clean_amount = amount.translate(_AMOUNT_STRIP_TABLE)
+            if clean_amount.isdecimal():
+                return _format_rands(int(clean_amount))
+
+            # Fall back to the first run of digits for amounts with trailing text, e.g. "R 1 500 per month"
+            numbers = _NUM_RE.findall(amount.replace(' ', ''))
             if numbers:
                 clean_amount = numbers[0].replace(',', '')
                 if clean_amount.isdigit():
-                    return f"R{int(clean_amount):,}"
+                    return _format_rands(int(clean_amount))
             return amount
         
-        if isinstance(amount, (int, float)):
-            return f"R{int(amount):,}"
-        
         return str(amount)
+
+    @staticmethod
+    def _format_amount(amount):
+        """Formats an amount the note generator calculated itself, skipping the input checks in format_currency
+
+        Args:
+            amount (Union[int, float]): The amount to format
+
+        Returns:
+            str: The formatted amount, e.g. "R27,000"
+        """
+        return _format_rands(int(amount)) if amount else "R0"
     
     
-    def calculate_transfer_duty(self, price):
+    @staticmethod
+    def calculate_transfer_duty(price):
         """
         Calculate the transfer duty based on the property price.
 
@@ -71,38 +355,36 @@ class PropertyNoteGenerator:
             or below the minimum threshold for transfer duty.
         """
 
-        if not price or not str(price).replace(',', '').isdigit():
+        # Prices computed upstream are already numeric, so only strings need cleaning
+        try:
+            price_num = int(price.translate(_AMOUNT_STRIP_TABLE) if isinstance(price, str) else price)
+        except (TypeError, ValueError, OverflowError):
             return 0
-        
-        price_num = int(str(price).replace(',', ''))
-        
-        if price_num <= 1210000:
+
+        if price_num <= 0:
             return 0
-        elif price_num <= 1663800:
-            return (price_num - 1210000) * 0.03
-        elif price_num <= 2329300:
-            return 13614 + (price_num - 1663800) * 0.06
-        elif price_num <= 2994800:
-            return 53544 + (price_num - 2329300) * 0.08
-        elif price_num <= 13310000:
-            return 106784 + (price_num - 2994800) * 0.11
-        else:
-            return 1241456 + (price_num - 13310000) * 0.13
         
-    def calculate_once_off_costs(self, price):
+        base, rate, lower_bound = _DUTY_BRACKETS[bisect.bisect_left(_DUTY_THRESHOLDS, price_num)]
+        return base + (price_num - lower_bound) * rate
+        
+    def calculate_once_off_costs(self, price, deposit=None, bond_amount=None):
         """Calculate all the once-off costs associated with buying a property
 
         This includes the deposit, transfer duty, bond registration, transfer costs, attorney fees, bond origination, moving costs, security setup, and immediate repairs.
 
         Args:
             price (int): The price of the property
+            deposit (float, optional): The deposit, if already calculated. Defaults to 10% of the price.
+            bond_amount (float, optional): The bond amount, if already calculated. Defaults to the price less the deposit.
 
         Returns:
             dict: A dictionary containing all the calculated costs
         """
-        deposit = price * 0.10
+        if deposit is None:
+            deposit = price * 0.10
+        if bond_amount is None:
+            bond_amount = price - deposit
         transfer_duty = self.calculate_transfer_duty(price)
-        bond_amount = price - deposit
 
         bond_registration = bond_amount * 0.01
         transfer_costs = price * 0.01
@@ -138,8 +420,8 @@ class PropertyNoteGenerator:
 
         Args:
             bond_amount (float): The outstanding bond amount.
-            levies (float): The monthly levies for the property.
-            rates_taxes (float): The monthly rates and taxes for the property.
+            levies (Union[str, float]): The monthly levies for the property.
+            rates_taxes (Union[str, float]): The monthly rates and taxes for the property.
             price (float): The purchase price of the property.
 
         Returns:
@@ -180,7 +462,8 @@ class PropertyNoteGenerator:
         }
 
         
-    def generate_amenities_frontmatter(self, key_features):
+    @staticmethod
+    def generate_amenities_frontmatter(key_features):
         """
         Generate YAML frontmatter for amenities based on key_features.
 
@@ -190,23 +473,10 @@ class PropertyNoteGenerator:
         Returns:
             str: YAML frontmatter for amenities.
         """
-        amenities_yaml = ""
-        
-        all_amenities = set()
-        
-        if key_features:
-            for amenity, present in key_features.items():
-                if present:
-                    all_amenities.add(amenity)
-        
-        if all_amenities:
-            amenities_yaml = "amenities:\n"
-            for amenity in sorted(all_amenities):
-                amenities_yaml += f"  - {amenity}\n"
-        
-        return amenities_yaml.strip()
+        return _amenities_yaml(frozenset(amenity for amenity, present in (key_features or {}).items() if present))
             
-    def calculate_bond_payment(self, principal, rate=0.1075, years=20):
+    @staticmethod
+    def calculate_bond_payment(principal, rate=0.1075, years=20):
         """
         Calculate the monthly bond payment for a given principal amount, interest rate, and repayment term.
 
@@ -221,15 +491,10 @@ class PropertyNoteGenerator:
         if not principal or principal <= 0:
             return 0
         
-        monthly_rate = rate / 12
-        num_payments = years * 12
-        
-        if monthly_rate == 0:
-            return principal / num_payments
-        
-        return principal * (monthly_rate * (1 + monthly_rate)**num_payments) / ((1 + monthly_rate)**num_payments - 1)
+        return principal * _bond_factor(rate, years)
     
-    def generate_filename(self, property_data):
+    @staticmethod
+    def generate_filename(property_data):
         """
         Generate a filename for the Obsidian note based on the property data
 
@@ -253,7 +518,8 @@ class PropertyNoteGenerator:
         
         return f"{filename}.md"
     
-    def extract_numeric_value(self, value):
+    @staticmethod
+    def extract_numeric_value(value):
         """Extract numeric value from string or return 0 if invalid"""
         if value is None:
             return 0.0
@@ -262,20 +528,21 @@ class PropertyNoteGenerator:
             return float(value)
 
         if isinstance(value, str):
-            clean = value.replace(',', '').replace('R', '').replace('$', '').strip()
             try:
-                return float(clean)
+                return float(value.translate(_NUMERIC_STRIP_TABLE))
             except ValueError:
                 pass
 
         return 0.0
     
-    def generate_obsidian_note(self, property_data):
+    def generate_obsidian_note(self, property_data, out=None):
         """
         Generate an Obsidian note for a given property data.
 
         Args:
             property_data (dict): The property data to generate a note for.
+            out (TextIO, optional): A writable text stream. If given, the note is written to it
+                section by section instead of being collected in memory, and the returned content is None.
 
         Returns:
             dict: A dictionary containing the filename, content, and geography data for the generated note.
@@ -286,30 +553,28 @@ class PropertyNoteGenerator:
         
         # Extract basic information using new structure
         title = property_data.get('listing_name', 'Unknown Property')
-        price = int(property_data.get('price', 0)) if property_data.get('price') else 0
+        price = int(property_data.get('price') or 0)
         
         # Get nested data
-        property_overview = property_data.get('property_overview', {}).get('property_overview', {})
-        rooms = property_data.get('property_overview', {}).get('rooms', {})
-        external_features = property_data.get('property_overview', {}).get('external_features', {})
-        poi = property_data.get('property_overview', {}).get('points_of_interest', {})
-        key_features = property_data.get('key_features', {})
-        agent_info = property_data.get('listing_organized_by', {})
+        overview_sections = property_data.get('property_overview', _EMPTY)
+        property_overview = overview_sections.get('property_overview', _EMPTY)
+        rooms = overview_sections.get('rooms', _EMPTY)
+        external_features = overview_sections.get('external_features', _EMPTY)
+        poi = overview_sections.get('points_of_interest', _EMPTY)
+        key_features = property_data.get('key_features', _EMPTY)
+        agent_info = property_data.get('listing_organized_by', _EMPTY)
         
         # Calculate financials
         deposit = price * 0.1
         bond_amount = price - deposit
         
-        # Get monthly costs from property overview
-        levies = self.extract_numeric_value(property_overview.get('levies', '0'))
-        rates_taxes = self.extract_numeric_value(property_overview.get('rates_and_taxes', '0'))
-        
-        # Estimated additional costs
-        once_off_costs = self.calculate_once_off_costs(price)
+        # Estimated additional costs. Levies and rates come from the property overview as scraped,
+        # and are parsed once by calculate_monthly_costs.
+        once_off_costs = self.calculate_once_off_costs(price, deposit=deposit, bond_amount=bond_amount)
         total_monthly_costs = self.calculate_monthly_costs(
             bond_amount=bond_amount,
-            levies=levies,
-            rates_taxes=rates_taxes,
+            levies=property_overview.get('levies', '0'),
+            rates_taxes=property_overview.get('rates_and_taxes', '0'),
             price=price
         )
         
@@ -320,215 +585,108 @@ class PropertyNoteGenerator:
         # Generate amenities for frontmatter
         amenities_yaml = self.generate_amenities_frontmatter(key_features)
 
+        # Single timestamp shared by the frontmatter and the footer
+        now = _current_timestamp()
+
         # Create clean frontmatter optimized for dataview
-        frontmatter = f"""---
-date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-tags:
-  - property
-  - portfolio
-cssclasses:
-  - page-grid
-  - pen-blue
-  - page-white
-property_type: {property_data.get('property_type', '')}
-status: interested
-source: {property_data.get('source', 'Property24')}
-province: {property_data.get('province', '')}
-city: {property_data.get('city', '')}
-suburb: {property_data.get('suburb', '')}
-bedrooms: {property_data.get('bedrooms', 'null')}
-bathrooms: {property_data.get('bathrooms', 'null')}
-{amenities_yaml}
----
-"""
+        frontmatter = _FRONTMATTER_TEMPLATE.format(
+            date=now,
+            property_type=property_data.get('property_type', ''),
+            source=property_data.get('source', 'Property24'),
+            province=property_data.get('province', ''),
+            city=property_data.get('city', ''),
+            suburb=property_data.get('suburb', ''),
+            bedrooms=property_data.get('bedrooms', 'null'),
+            bathrooms=property_data.get('bathrooms', 'null'),
+            amenities_yaml=amenities_yaml
+        )
         
-        note_content = f"""{frontmatter}
-
-# {title}
-
-## Location & Basic Info
-
-| Field | Value |
-|-------|-------|
-| **Address** | {property_data.get('address', 'N/A')} |
-| **Suburb** | {property_data.get('suburb', 'N/A')} |
-| **City** | {property_data.get('city', 'N/A')} |
-| **Province** | {property_data.get('province', 'N/A')} |
-| **Property Type** | {property_data.get('property_type', 'N/A')} |
-| **Lifestyle** | {property_overview.get('lifestyle', 'N/A')} |
-| **Listing ID** | {property_data.get('listing_id', 'N/A')} |
-| **Listed Date** | {property_data.get('listing_date', 'N/A')} |
-
-## Financial Analysis
-
-### Purchase Costs
-
-| Item | Amount |
-|------|--------|
-| **Purchase Price** | {self.format_currency(price)} |
-| **Deposit (10%)** | {self.format_currency(once_off_costs['deposit'])} |
-| **Transfer Duty** | {self.format_currency(once_off_costs['transfer_duty'])} |
-| **Bond Registration** | {self.format_currency(once_off_costs['bond_registration'])} |
-| **Transfer Costs** | {self.format_currency(once_off_costs['transfer_costs'])} |
-| **Attorney Fees** | {self.format_currency(once_off_costs['attorney_fees'])} |
-| **Bond Origination** | {self.format_currency(once_off_costs['bond_origination'])} |
-| **Moving Costs** | {self.format_currency(once_off_costs['moving_costs'])} |
-| **Security Setup** | {self.format_currency(once_off_costs['security_setup'])} |
-| **Immediate Repairs** | {self.format_currency(once_off_costs['immediate_repairs'])} |
-| **Total Additional Once Off Cost** | {self.format_currency(once_off_costs['additional_total_once_off'])} |
-| **Grand Total Once Off Cost** | {self.format_currency(once_off_costs['grand_total'])} |
-
-### Bond Calculations
-
-| Item | Amount |
-|------|--------|
-| **Deposit (10%)** | {self.format_currency(deposit)} |
-| **Bond Amount** | {self.format_currency(bond_amount)} |
-| **Interest Rate** | 10.75% (prime) |
-| **Bond Term** | 20 years |
-| **Monthly Payment** | {self.format_currency(total_monthly_costs['bond_payment'])} |
-
-### Monthly Costs
-
-| Item | Amount |
-|------|--------|
-| **Bond Payment** | {self.format_currency(total_monthly_costs['bond_payment'])} |
-| **Levies** | {self.format_currency(total_monthly_costs['levies'])} |
-| **Rates & Taxes** | {self.format_currency(total_monthly_costs['rates_taxes'])} |
-| **Insurance** | {self.format_currency(total_monthly_costs['insurance'])} |
-| **Maintenance** | {self.format_currency(total_monthly_costs['maintenance'])} |
-| **Utilities** | {self.format_currency(total_monthly_costs['utilities'])} |
-| **Security** | {self.format_currency(total_monthly_costs['security'])} |
-| **Total Monthly** | {self.format_currency(total_monthly_costs['total_monthly'])} |
-
-### Investment Metrics
-
-| Metric | Value |
-|--------|-------|
-| **Price per m2** | {self.format_currency(property_overview.get('price_per_m2', None))} |
-| **Transfer Duty Exempt** | {property_overview.get('no_transfer_duty', 'N/A')} |
-| **Break-even Rental** | {self.format_currency(total_monthly_costs['total_monthly'])} |
-
-## Property Features
-
-### Room Layout
-
-"""
+        # Format every cost once, keyed by its template placeholder
+        cost_fields = {key: self._format_amount(value) for key, value in once_off_costs.items()}
+        cost_fields.update({f"monthly_{key}": self._format_amount(value) for key, value in total_monthly_costs.items()})
+
+        # Template fields read straight from the property data fall back to 'N/A'
+        fields = _NoteFields(property_data)
+        fields.update(cost_fields)
+
+        # Collect the note in fragments and join once at the end, or stream them straight to `out`
+        parts = []
+        write = out.write if out is not None else parts.append
+        fields.update(
+            frontmatter=frontmatter,
+            title=title,
+            lifestyle=property_overview.get('lifestyle', 'N/A'),
+            purchase_price=self._format_amount(price),
+            bond_deposit=self._format_amount(deposit),
+            bond_amount=self._format_amount(bond_amount),
+            price_per_m2=self.format_currency(property_overview.get('price_per_m2', None)),
+            no_transfer_duty=property_overview.get('no_transfer_duty', 'N/A')
+        )
+        write(_HEADER_TEMPLATE.format_map(fields))
         
         # Add rooms dynamically
         if rooms:
             for room_type, room_data in rooms.items():
-                room_name = room_type.replace('_', ' ').title()
+                room_name = _display_name(room_type)
                 if isinstance(room_data, list):
                     count = room_data[0] if room_data else 'N/A'
                     details = ', '.join(room_data[1:]) if len(room_data) > 1 else ''
                 else:
                     count = room_data
                     details = ''
-                note_content += f"- **{room_name}**: {count}"
+                write(f"- **{room_name}**: {count}")
                 if details:
-                    note_content += f" ({details})"
-                note_content += "\n"
+                    write(f" ({details})")
+                write("\n")
         
-        note_content += f"""
-
-### Property Specifications
-
-| Specification | Value |
-|---------------|-------|
-| **Floor Size** | {property_data.get('floor_size', 'N/A')} m2 |
-| **Erf Size** | {property_overview.get('erf_size', 'N/A')} |
-| **Levies** | {self.format_currency(levies)} |
-| **Rates & Taxes** | {self.format_currency(rates_taxes)} |
-| **Pets Allowed** | {property_data.get('allowed_pets', 'N/A')} |
-"""
+        fields['erf_size'] = property_overview.get('erf_size', 'N/A')
+        write(_SPECIFICATIONS_TEMPLATE.format_map(fields))
 
         # Add key features
         if key_features:
-            note_content += "\n### Key Features\n"
+            write("\n### Key Features\n")
             for feature, value in key_features.items():
                 if isinstance(value, bool) and value:
-                    note_content += f"- {feature.replace('_', ' ').title()}\n"
+                    write(f"- {_display_name(feature)}\n")
                 elif not isinstance(value, bool) and value:
-                    note_content += f"- **{feature.replace('_', ' ').title()}**: {value}\n"
+                    write(f"- **{_display_name(feature)}**: {value}\n")
 
         # Add external features
         if external_features:
-            note_content += "\n### External Features\n"
+            write("\n### External Features\n")
             for feature, detail in external_features.items():
-                note_content += f"- **{feature.replace('_', ' ').title()}**: {detail}\n"
+                write(f"- **{_display_name(feature)}**: {detail}\n")
 
-        note_content += f"""
+        write("""
 
 ## Points of Interest
-"""
+""")
         
-        # Add points of interest
+        # Add points of interest, joined into a single fragment
         if poi:
+            poi_parts = []
             for category, places in poi.items():
                 if places:  # Only show categories with places
-                    note_content += f"\n### {category.replace('_', ' ').title()}\n\n"
-                    for place in places[:5]:  # Show first 5
-                        note_content += f"- **{place['name']}** - {place['distance']}\n"
+                    poi_parts.append(f"\n### {_display_name(category)}\n\n")
+                    poi_parts.extend(f"- **{place['name']}** - {place['distance']}\n" for place in places[:5])  # Show first 5
                     if len(places) > 5:
-                        note_content += f"- *...and {len(places) - 5} more*\n"
-
-        note_content += f"""
-
-## Agent Information
-
-| Field | Value |
-|-------|-------|
-| **Agent Name** | {agent_info.get('name', 'N/A')} |
-| **Agency** | {agent_info.get('works_for', {}).get('name', 'N/A')} |
-| **Agent Profile** | [{agent_info.get('name', 'View Profile')}]({agent_info.get('agent_url', '')}) |
-| **Agency Profile** | [{agent_info.get('works_for', {}).get('name', 'View Agency')}]({agent_info.get('works_for', {}).get('works_for_url', '')}) |
-
-## Viewing & Assessment
-
-### Viewing Details
-
-- **Viewing Date**: 
-- **Viewing Time**: 
-- **Viewing Notes**: 
-
-### Property Assessment
-
-- **Overall Condition**: 
-- **Score (1-10)**: 
-- **Pros**: 
-  - 
-- **Cons**: 
-  - 
-
-### Decision
-
-- **Status**: 
-- **Decision**: 
-- **Reason**: 
-- **Next Steps**: 
-
-## Documents & Links
-
-### Required Documents
-
-- [ ] Title Deed
-- [ ] Rates Certificate  
-- [ ] Electrical Certificate
-- [ ] Plumbing Certificate
-- [ ] Building Plans
-- [ ] Body Corporate Rules (if applicable)
-
-### Links
-
-- **Property Listing**: [View on Property24]({property_data.get('url', '')})
-- **Property Images**: [View Images]({property_data.get('listing_image', '')})
-
----
-
-*Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*  
-*Scraped from: {property_data.get('source', 'N/A')} on {property_data.get('scraped_date', 'N/A')}*
-"""
+                        poi_parts.append(f"- *...and {len(places) - 5} more*\n")
+            write(''.join(poi_parts))
+
+        works_for = agent_info.get('works_for', _EMPTY)
+        fields.update(
+            agent_name=agent_info.get('name', 'N/A'),
+            agency_name=works_for.get('name', 'N/A'),
+            agent_profile_label=agent_info.get('name', 'View Profile'),
+            agent_url=agent_info.get('agent_url', ''),
+            agency_profile_label=works_for.get('name', 'View Agency'),
+            agency_url=works_for.get('works_for_url', ''),
+            url=property_data.get('url', ''),
+            listing_image=property_data.get('listing_image', ''),
+            date=now
+        )
+        write(_FOOTER_TEMPLATE.format_map(fields))
+        note_content = ''.join(parts) if out is None else None
         
         return {
             'filename': filename,
@@ -540,13 +698,27 @@ bathrooms: {property_data.get('bathrooms', 'null')}
             }
         }
     
-    def save_note_to_obsidian(self, note_data: Dict):
-        """Save note data to a new note in the specified directory"""
-        property_geography = note_data['geography']
-        province = property_geography['province']
-        city = property_geography['city']
-        suburb = property_geography['suburb']
+    def generate_obsidian_notes(self, properties, processes=None, chunksize=16):
+        """
+        Generate Obsidian notes for many properties in parallel.
+
+        Each note only depends on its own property data, so the batch is spread over a
+        process pool. Every worker builds its own generator once, rather than receiving
+        this one with every task.
+
+        Args:
+            properties (Iterable[dict]): The property data to generate notes for.
+            processes (int, optional): The number of worker processes. Defaults to the CPU count.
+            chunksize (int, optional): The number of properties sent to a worker at a time. Defaults to 16.
 
+        Returns:
+            list: The generated notes, in the same order as the input properties.
+        """
+        with multiprocessing.Pool(processes, initializer=_init_note_worker) as pool:
+            return list(pool.imap(_generate_note_in_worker, properties, chunksize=chunksize))
+
+    def _note_directory(self, province, city, suburb):
+        """Return the vault folder for a property's geography, creating it if needed"""
         if not province:
             property_folder = "Other"
         elif not city:
@@ -557,9 +729,86 @@ bathrooms: {property_data.get('bathrooms', 'null')}
             property_folder = os.path.join(province, city, suburb)
 
         property_directory = os.path.join(self.full_path, property_folder)
+        # Not cached, so a folder removed from the vault while running is simply recreated
         os.makedirs(property_directory, exist_ok=True)
+        return property_directory
 
-        filepath = os.path.join(property_directory, note_data['filename'])
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(note_data['content'])
-        
+    def note_path(self, property_data):
+        """
+        Return the path a property's note is saved to, inside its province/city/suburb folder.
+
+        Args:
+            property_data (dict): The property data the note is generated from.
+
+        Returns:
+            Path: The full path of the note file in the vault.
+        """
+        property_directory = self._note_directory(
+            property_data.get('province', None),
+            property_data.get('city', None),
+            property_data.get('suburb', None)
+        )
+        return Path(property_directory, self.generate_filename(property_data))
+
+    def save_note_to_obsidian(self, note_data: Dict):
+        """Save note data to a new note in the specified directory"""
+        if note_data['content'] is None:
+            raise Exception("Note content was streamed to another writer and cannot be saved. Use stream_note_to_obsidian to write it straight into the vault.")
+
+        property_geography = note_data['geography']
+        property_directory = self._note_directory(
+            property_geography['province'],
+            property_geography['city'],
+            property_geography['suburb']
+        )
+
+        # Encode once and write the bytes directly, skipping the text-mode writer
+        Path(property_directory, note_data['filename']).write_bytes(note_data['content'].encode('utf-8'))
+
+    def stream_note_to_obsidian(self, property_data):
+        """
+        Generate a property's note and stream it straight into its file in the vault.
+
+        The note is written section by section rather than built in memory first. It is streamed
+        into a temporary file in the same folder and only moved over the note once generation has
+        finished, so a failure part way never leaves a partial note in the vault.
+
+        Args:
+            property_data (dict): The property data to generate a note for.
+
+        Returns:
+            dict: The note data as returned by generate_obsidian_note, with content set to None.
+        """
+        if not property_data:
+            return None
+
+        path = self.note_path(property_data)
+        # newline='' keeps the same bytes as save_note_to_obsidian on every platform
+        out = tempfile.NamedTemporaryFile(
+            'w', encoding='utf-8', newline='', buffering=_NOTE_WRITE_BUFFER,
+            dir=path.parent, prefix=f".{path.name}.", suffix='.tmp', delete=False
+        )
+        try:
+            with out:
+                note_data = self.generate_obsidian_note(property_data, out=out)
+            os.chmod(out.name, _NOTE_FILE_MODE)
+            os.replace(out.name, path)
+        except BaseException:
+            os.unlink(out.name)
+            raise
+
+        # The path fixes the filename, even if a timestamped fallback name would differ by now
+        note_data['filename'] = path.name
+        return note_data
+
+
+_worker_generator = None
+
+def _init_note_worker():
+    """Create the note generator used by a pool worker"""
+    global _worker_generator
+    _worker_generator = PropertyNoteGenerator()
+
+def _generate_note_in_worker(property_data):
+    """Generate a single note inside a pool worker"""
+    return _worker_generator.generate_obsidian_note(property_data)
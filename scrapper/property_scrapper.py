@@ -1,16 +1,87 @@
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
 import re
 import json
 from datetime import datetime
+import copy
+import functools
 import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from scrapper.obsidian_note_generator import PropertyNoteGenerator
 
+_WS_RE = re.compile(r'\s+')
+_MONEY_RE = re.compile(r'^R\s*([\d\s,]+)')
+_NON_WORD_RE = re.compile(r'[^\w_]')
+_NUM_RE = re.compile(r'[\d,]+')
+
+# JSON-LD breadcrumb positions that name the listing's location
+_BREADCRUMB_LOCATION_KEYS = {2: "province", 3: "city", 4: "suburb"}
+
+# Classes of the listing page sections read by the extractors, everything else is skipped while parsing
+_PARSED_SECTION_CLASSES = frozenset(('p24_propertyOverview', 'p24_keyFeaturesContainer'))
+
+
+class _ListingStrainer(SoupStrainer):
+    """Only build the JSON-LD script, the property overview card and the key features containers into the soup"""
+
+    def allow_tag_creation(self, nsprefix, name, attrs):
+        return self._is_parsed_section(name, attrs or {})
+
+    # BeautifulSoup releases before 4.13 consult search_tag instead
+    def search_tag(self, markup_name, markup_attrs):
+        return self._is_parsed_section(markup_name, markup_attrs or {})
+
+    @staticmethod
+    def _is_parsed_section(name, attrs):
+        if name == 'script':
+            return attrs.get('type') == 'application/ld+json'
+        classes = attrs.get('class') or ()
+        if isinstance(classes, str):
+            classes = classes.split()
+        return name == 'div' and not _PARSED_SECTION_CLASSES.isdisjoint(classes)
+
+
+_LISTING_STRAINER = _ListingStrainer()
+# The POI fragment is only read through its category blocks
+_POI_STRAINER = SoupStrainer('div', class_='js_P24_POICategory')
+
+
+@functools.lru_cache(maxsize=4096)
+def _snake_case(text):
+    """Convert a heading to snake_case, cached as panel and feature names repeat across listings"""
+    text = text.strip()
+    text = _WS_RE.sub('_', text)
+    text = _NON_WORD_RE.sub('', text)
+    return text.lower()
+
+
 class PropertyScrapper:
-    def __init__(self) -> None:
+    __slots__ = ('headers', 'session', 'cache_size', 'cache_ttl', '_scrape_cache', '_scrape_cache_lock')
+
+    def __init__(self, cache_size=2048, cache_ttl=3600) -> None:
+        """
+        Args:
+            cache_size (int, optional): The most scraped listings kept for repeat requests, least recently used first out. Defaults to 2048.
+            cache_ttl (float, optional): The seconds a scraped listing is reused before it is fetched again. Defaults to 3600.
+        """
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
+        # Reuse one pooled connection for the listing page and its follow-up AJAX calls
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=Retry(total=3, backoff_factor=0.3)))
+        # Successful scrapes keyed by URL, as (expiry, data) in least to most recently used order,
+        # so repeat requests within the TTL skip the download and parse
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+        self._scrape_cache = OrderedDict()
+        self._scrape_cache_lock = threading.Lock()
 
     def clean_text(self, text):
         """
@@ -26,9 +97,13 @@ class PropertyScrapper:
         if not text:
             return ""
         text = text.strip()
-        text = re.sub(r'\s+', ' ', text)
-        text = re.sub(r'[²\u00b2]', '2', text)
-        money_match = re.match(r'^R\s*([\d\s,]+)', text)
+        # Any whitespace other than a single ASCII space is unprintable, so most strings skip the regex entirely
+        if '  ' in text or not text.isprintable():
+            text = _WS_RE.sub(' ', text)
+        # '²' is a single code point, so a plain replace covers it without a second regex pass
+        text = text.replace('\u00b2', '2')
+        # _MONEY_RE is anchored on a leading 'R', so skip it for strings that cannot match
+        money_match = _MONEY_RE.match(text) if text.startswith('R') else None
         if money_match:
             text = float(money_match.group(1).replace(' ', '').replace(',', ''))
         return text
@@ -48,17 +123,14 @@ class PropertyScrapper:
         """
         if not text:
             return ""
-        text = text.strip()
-        text = re.sub(r'\s+', '_', text)
-        text = re.sub(r'[^\w_]', '', text)
-        return text.lower()
+        return _snake_case(text)
     
     def extract_number(self, text):
         """Extract numbers from text"""
         if not text:
             return ""
-        numbers = re.findall(r'[\\d,]+', str(text))
-        return numbers[0].replace(',', '') if numbers else ""
+        number = _NUM_RE.search(str(text))
+        return number.group().replace(',', '') if number else ""
     
     def extract_property_overview(self, listing_number: str, soup: BeautifulSoup):
         """
@@ -89,12 +161,11 @@ class PropertyScrapper:
             key_elem = panel.find('div', class_="panel-heading")
             key_text = self.to_snake_case(key_elem.get_text(strip=True))
             if key_text:
-                overview_data[key_text] = {}
-                panel_rows = panel.find_all('div', class_='p24_propertyOverviewRow')
+                panel_data = overview_data[key_text] = {}
                 if key_text == "points_of_interest":
-                    response = requests.get(poi_url, headers=self.headers)
+                    response = self.session.get(poi_url)
                     if response.status_code == 200:
-                        poi_soup = BeautifulSoup(response.content, 'html.parser')
+                        poi_soup = BeautifulSoup(response.content, 'lxml', from_encoding='utf-8', parse_only=_POI_STRAINER)
                         poi_categories = poi_soup.find_all('div', class_='js_P24_POICategory')
 
                         poi_data = {}
@@ -120,17 +191,17 @@ class PropertyScrapper:
 
                         overview_data[key_text] = poi_data
                 else:
-                    for row in panel_rows:
+                    # Rows are only needed outside the POI panel, whose data comes from the AJAX call
+                    is_rooms = key_text == "rooms"
+                    for row in panel.find_all('div', class_='p24_propertyOverviewRow'):
                         key_elem = row.find('div', class_='p24_propertyOverviewKey')
                         value_elem = row.find('div', class_='noPadding')
-                        if key_text == "rooms":
-                            values = []
-                            for value in value_elem.find_all('div', class_='p24_info'):
-                                value = self.clean_text(value.get_text(strip=True))
-                                values.append(value)
-                            overview_data[key_text][self.to_snake_case(self.clean_text(key_elem.get_text(strip=True)))] = values[0] if len(values) == 1 else values
+                        row_key = self.to_snake_case(self.clean_text(key_elem.get_text(strip=True)))
+                        if is_rooms:
+                            values = [self.clean_text(value.get_text(strip=True)) for value in value_elem.find_all('div', class_='p24_info')]
+                            panel_data[row_key] = values[0] if len(values) == 1 else values
                         else:
-                            overview_data[key_text][self.to_snake_case(self.clean_text(key_elem.get_text(strip=True)))] = self.clean_text(value_elem.get_text(strip=True))
+                            panel_data[row_key] = self.clean_text(value_elem.get_text(strip=True))
         
         return overview_data
     
@@ -184,7 +255,7 @@ class PropertyScrapper:
         """
         Extract data from JSON-LD information in the property listing page.
         
-        The JSON-LD data is located in a script tag with type 'application/ld+json'.
+        The JSON-LD data is located in the first script tag with type 'application/ld+json' that holds a '@graph'.
         The data is extracted and restructured into a dictionary with the following keys:
         
         * listing_date: The date the listing was posted.
@@ -221,17 +292,19 @@ class PropertyScrapper:
         Returns:
             dict: A dictionary containing the extracted data.
         """
-        json_scripts = soup.find_all('script', type='application/ld+json')
-        
-        if not json_scripts:
-            return {}
-        
-        # Extract JSON-LD data
-        script = json_scripts[0]
-        json_data = json.loads(script.string)
-        graph_data = json_data.get('@graph', [])
-        
-        if not graph_data:
+        # Pages can carry several JSON-LD blocks (e.g. an Organization one), so use the first with a @graph
+        for script in soup.find_all('script', type='application/ld+json'):
+            if not script.string:
+                continue
+            try:
+                json_data = json.loads(script.string)
+            except ValueError:
+                # A malformed block elsewhere on the page should not hide the listing's own JSON-LD
+                continue
+            graph_data = json_data.get('@graph') if isinstance(json_data, dict) else None
+            if graph_data:
+                break
+        else:
             return {}
         
         property_information = graph_data[0]
@@ -244,51 +317,79 @@ class PropertyScrapper:
         # Assuming Property 24 doesnt change its structure positions 2 - 4 are location specific
         breadcrumb_list = property_information.get("breadcrumb", {}).get("itemListElement", [])
         for breadcrumb_item in breadcrumb_list:
-            if breadcrumb_item.get("position") == 2:
-                final_info["province"] = breadcrumb_item.get("name")
-            elif breadcrumb_item.get("position") == 3:
-                final_info["city"] = breadcrumb_item.get("name")
-            elif breadcrumb_item.get("position") == 4:
-                final_info["suburb"] = breadcrumb_item.get("name")
-            elif breadcrumb_item.get("position") == 5:
+            position = breadcrumb_item.get("position")
+            location_key = _BREADCRUMB_LOCATION_KEYS.get(position)
+            if location_key:
+                final_info[location_key] = breadcrumb_item.get("name")
+            elif position == 5:
                 listing_id = breadcrumb_item.get("name").split(":")[1].strip()
                 final_info["listing_id"] = listing_id
         
         # About information
         about_info = property_information.get("about", {})
+        floor_size = about_info.get("floorSize", {})
+        address = about_info.get("address", {})
         final_info["property_type"] = about_info.get("@type")
         final_info["bedrooms"] = about_info.get("numberOfBedrooms")
         final_info["bathrooms"] = about_info.get("numberOfBathroomsTotal")
-        final_info["floor_size"] = about_info.get("floorSize", {}).get("value")
+        final_info["floor_size"] = floor_size.get("value")
         final_info["allowed_pets"] = about_info.get("petsAllowed")
-        final_info["address"] = about_info.get("address", {}).get("streetAddress")
-        final_info["country"] = about_info.get("address", {}).get("addressCountry")
+        final_info["address"] = address.get("streetAddress")
+        final_info["country"] = address.get("addressCountry")
         final_info["latitude"] = about_info.get("latitude")
         final_info["longitude"] = about_info.get("longitude")
 
         # Offer Information
         offers_info = property_information.get("offers", {})
-        final_info["price"] = offers_info.get("priceSpecification", {}).get("price")
-        final_info["price_currency"] = offers_info.get("priceSpecification", {}).get("priceCurrency")
+        price_specification = offers_info.get("priceSpecification", {})
+        offered_by = offers_info.get("offeredBy", {})
+        works_for = offered_by.get("worksFor", {})
+        final_info["price"] = price_specification.get("price")
+        final_info["price_currency"] = price_specification.get("priceCurrency")
         final_info["listing_organized_by"] = {
-            "name": offers_info.get("offeredBy", {}).get("name"),
-            "offered_by": offers_info.get("offeredBy", {}).get("@type"),
-            "agent_url": offers_info.get("offeredBy", {}).get("url"),
+            "name": offered_by.get("name"),
+            "offered_by": offered_by.get("@type"),
+            "agent_url": offered_by.get("url"),
             "works_for": {
-                "relation": offers_info.get("offeredBy", {}).get("worksFor", {}).get("@type"),
-                "name": offers_info.get("offeredBy", {}).get("worksFor", {}).get("name"),
-                "works_for_url": offers_info.get("offeredBy", {}).get("worksFor", {}).get("url")
+                "relation": works_for.get("@type"),
+                "name": works_for.get("name"),
+                "works_for_url": works_for.get("url")
             }
         }        
         return final_info
+
+    def _get_cached_scrape(self, url):
+        """Return a copy of the cached scrape for a URL, or None if it is missing or has expired"""
+        with self._scrape_cache_lock:
+            entry = self._scrape_cache.get(url)
+            if entry is None:
+                return None
+            expires_at, property_data = entry
+            if time.monotonic() >= expires_at:
+                del self._scrape_cache[url]
+                return None
+            self._scrape_cache.move_to_end(url)
+        return copy.deepcopy(property_data)
+
+    def _cache_scrape(self, url, property_data):
+        """Cache a copy of a successful scrape, evicting the least recently used entries beyond cache_size"""
+        if self.cache_size <= 0:
+            return
+        entry = (time.monotonic() + self.cache_ttl, copy.deepcopy(property_data))
+        with self._scrape_cache_lock:
+            self._scrape_cache[url] = entry
+            self._scrape_cache.move_to_end(url)
+            while len(self._scrape_cache) > self.cache_size:
+                self._scrape_cache.popitem(last=False)
     
     
-    def scrape_property24(self, url):
+    def scrape_property24(self, url, refresh=False):
         """
         Scrape a Property24 listing page and return the scraped data in a dictionary
 
         Args:
             url (str): The URL of the Property24 listing page to scrape
+            refresh (bool, optional): Fetch the page even if a recent scrape of it is cached. Defaults to False.
 
         Returns:
             dict: A dictionary containing the scraped data, with the following keys:
@@ -319,10 +420,16 @@ class PropertyScrapper:
         Raises:
             Exception: If there is an error scraping the page
         """
+        # A cached scrape keeps its original scraped_date, so notes show when the data was actually fetched
+        if not refresh:
+            cached = self._get_cached_scrape(url)
+            if cached is not None:
+                return cached
+
         try:
-            response = requests.get(url, headers=self.headers, timeout=10)
+            response = self.session.get(url, timeout=10)
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml', from_encoding='utf-8', parse_only=_LISTING_STRAINER)
             
             # Start with basic data
             property_data = {
@@ -342,13 +449,14 @@ class PropertyScrapper:
             # Extract key features from the main listing card
             property_data['key_features'] = self.extract_key_features(soup)
             
+            self._cache_scrape(url, property_data)
             return property_data
             
         except Exception as e:
             print(f"Error scraping Property24: {str(e)}")
             return None
     
-    def scrape_property(self, url):
+    def scrape_property(self, url, refresh=False):
         """
         Scrape a property listing page from the given URL.
 
@@ -356,18 +464,60 @@ class PropertyScrapper:
 
         Args:
             url (str): The URL of the property listing page to scrape
+            refresh (bool, optional): Fetch the page even if a recent scrape of it is cached. Defaults to False.
 
         Returns:
             dict: A dictionary containing the scraped data, or None if the URL is not supported
         """
         if 'property24' in url.lower():
-            return self.scrape_property24(url)
+            return self.scrape_property24(url, refresh=refresh)
         else:
             print("Currently only Property24 URLs are supported")
             return None
+
+    def scrape_properties(self, urls, workers=8, refresh=False):
+        """
+        Scrape many property listing pages concurrently.
+
+        Scraping is dominated by waiting on the network, so the URLs are spread over a
+        thread pool sharing this scraper's session. The worker count also caps how many
+        requests are in flight against Property24 at once.
+
+        Args:
+            urls (Iterable[str]): The URLs of the property listing pages to scrape
+            workers (int, optional): The number of worker threads. Defaults to 8.
+            refresh (bool, optional): Fetch every page even if a recent scrape of it is cached. Defaults to False.
+
+        Returns:
+            list: The scraped data for each URL in input order, with None for pages that failed
+        """
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(functools.partial(self.scrape_property, refresh=refresh), urls))
+
+
+_default_scrapper = None
+_default_scrapper_lock = threading.Lock()
+
+
+def get_default_scrapper():
+    """
+    Return a scraper shared across the process, so callers reuse its session and connection pool.
+
+    Its scrape cache uses the default bounds, at most 2048 listings each reused for an hour, so
+    a long running process neither grows without limit nor keeps serving stale listings. Pass
+    refresh=True to the scrape methods to fetch a listing again regardless.
+
+    Returns:
+        PropertyScrapper: The shared scraper, created on first use.
+    """
+    global _default_scrapper
+    with _default_scrapper_lock:
+        if _default_scrapper is None:
+            _default_scrapper = PropertyScrapper()
+    return _default_scrapper
     
 if __name__ == "__main__":
-    scraper = PropertyScrapper()
+    scraper = get_default_scrapper()
     
     # Test URL
     test_url = "https://www.property24.com/for-sale/zonnebloem/cape-town/western-cape/10166/114098915?plId=2083948&plt=3&plsIds=2111336"